@@ -33,6 +33,8 @@ except ImportError:
 
 from . import reflection
 from .column import PersistedColumn
+from .ddlelement import compile_shard_key
+from .ddlelement import compile_sort_key
 from .dtypes import _json_deserializer
 from .dtypes import JSON
 from .dtypes import VECTOR
@@ -42,7 +44,7 @@ class CaseInsensitiveDict(Dict[str, Any]):
 
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         data = dict(*args, **kwargs)
-        self._data = dict((k.lower(), k) for k in data)
+        self._data = {k.lower(): k for k in data}
         for k in data:
             self[k] = data[k]
 
@@ -79,6 +81,7 @@ class SingleStoreDBExecutionContext(MySQLExecutionContext):
 
 class Array(se.Tuple):
     __visit_name__ = 'array'
+    inherit_cache = True
 
 
 array = Array
@@ -137,7 +140,7 @@ class SingleStoreDBCompiler(MySQLCompiler):
             return None
 
     def visit_cast(self, cast: Any, **kw: Any) -> str:
-        type_ = self.process(cast.typeclause)
+        type_ = self.visit_typeclause(cast.typeclause)
         if type_ is None:
             util.warn(
                 'Datatype %s does not support CAST on SingleStoreDB; '
@@ -155,7 +158,7 @@ class SingleStoreDBCompiler(MySQLCompiler):
         return 'CAST(%s AS %s)' % (self.process(cast.clause, **kw), type_)
 
     def post_process_text(self, text: str, has_params: bool = False) -> str:
-        if has_params and self.preparer._double_percents:
+        if has_params and '%' in text and self.preparer._double_percents:
             text = text.replace('%', '%%')
         return text
 
@@ -212,19 +215,21 @@ class SingleStoreDBDDLCompiler(MySQLDDLCompiler):
 
     def visit_create_table(self, create: Any, **kw: Any) -> str:
         create_table_sql = super().visit_create_table(create, **kw)
-        shard_key = create.element.info.get('singlestoredb_shard_key')
+        info = create.element.info
+        keys: List[str] = []
+
+        shard_key = info.get('singlestoredb_shard_key')
         if shard_key is not None:
-            shard_columns = ', '.join(shard_key.columns)
-            shard_key_sql = f'SHARD KEY ({shard_columns})'
-            # Append the SHARD KEY definition to the original SQL
-            create_table_sql = f'{create_table_sql.rstrip()[:-2]},\n\t{shard_key_sql}\n)'
+            keys.append(compile_shard_key(shard_key, self))
 
-        sort_key = create.element.info.get('singlestoredb_sort_key')
+        sort_key = info.get('singlestoredb_sort_key')
         if sort_key is not None:
-            sort_columns = ', '.join(sort_key.columns)
-            sort_key_sql = f'SORT KEY ({sort_columns})'
-            # Append the SHARD KEY definition to the original SQL
-            create_table_sql = f'{create_table_sql.rstrip()[:-2]},\n\t{sort_key_sql}\n)'
+            keys.append(compile_sort_key(sort_key, self))
+
+        if keys:
+            # Append the SHARD KEY / SORT KEY definitions to the original SQL
+            keys_sql = ',\n\t'.join(keys)
+            create_table_sql = f'{create_table_sql.rstrip()[:-2]},\n\t{keys_sql}\n)'
 
         return create_table_sql
 
@@ -340,7 +345,7 @@ class SingleStoreDBDialect(MySQLDialect):
 
     driver = ''
 
-    supports_statement_cache = False
+    supports_statement_cache = True
 
     _double_percents = True
 
@@ -7,6 +7,8 @@ from sqlalchemy.sql.expression import TextClause
 
 
 class PersistedColumn(Column):
+    inherit_cache = True
+
     def __init__(
         self,
         *args: Any,
@@ -6,27 +6,40 @@ from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.schema import DDLElement
 
 
-class ShardKey(DDLElement):
+class _KeyElement(DDLElement):
+    """Base class for table-level key definitions."""
+
+    # DDL keyword the key is rendered with
+    keyword = ''
+
     def __init__(self, *columns: Any) -> None:
         self.columns = columns
 
     def __repr__(self) -> str:
-        return 'ShardKey(%s)' % ', '.join([repr(x) for x in self.columns])
+        return '%s(%s)' % (
+            type(self).__name__, ', '.join([repr(x) for x in self.columns]),
+        )
+
+
+def _compile_key(element: _KeyElement, compiler: Any) -> str:
+    return '%s (%s)' % (
+        element.keyword, ', '.join([str(x) for x in element.columns]),
+    )
+
+
+class ShardKey(_KeyElement):
+    keyword = 'SHARD KEY'
 
 
 @compiles(ShardKey, 'singlestoredb.mysql')
 def compile_shard_key(element: Any, compiler: Any, **kw: Any) -> str:
-    return 'SHARD KEY (%s)' % ', '.join([str(x) for x in element.columns])
+    return _compile_key(element, compiler)
 
 
-class SortKey(DDLElement):
-    def __init__(self, *columns: Any) -> None:
-        self.columns = columns
-
-    def __repr__(self) -> str:
-        return 'SortKey(%s)' % ', '.join([repr(x) for x in self.columns])
+class SortKey(_KeyElement):
+    keyword = 'SORT KEY'
 
 
 @compiles(SortKey, 'singlestoredb.mysql')
 def compile_sort_key(element: Any, compiler: Any, **kw: Any) -> str:
-    return 'SORT KEY (%s)' % ', '.join([str(x) for x in element.columns])
+    return _compile_key(element, compiler)
@@ -3,9 +3,11 @@
 from __future__ import annotations
 
 import re
+import sys
 from typing import Any
 from typing import Dict
 from typing import List
+from typing import Optional
 from typing import Tuple
 
 from sqlalchemy import log
@@ -43,6 +45,9 @@ def _re_compile(regex: str) -> Any:
     return re.compile(regex, re.I | re.UNICODE)
 
 
+_re_empty_shard_key = _re_compile(r'\s+,\s+SHARD\s+KEY\s+\(\)\s+')
+
+
 def _strip_values(values: List[str]) -> List[str]:
     """Strip reflected values quotes"""
     strip_values = []
@@ -54,6 +59,13 @@ def _strip_values(values: List[str]) -> List[str]:
     return strip_values
 
 
+def _copy_spec(spec: Any) -> Any:
+    """Copy a constraint spec so callers can't mutate a cached one"""
+    if not isinstance(spec, dict):
+        return spec
+    return {k: list(v) if isinstance(v, list) else v for k, v in spec.items()}
+
+
 def cleanup_text(raw_text: str) -> str:
     if '\\' in raw_text:
         raw_text = re.sub(
@@ -66,21 +78,90 @@ def cleanup_text(raw_text: str) -> str:
 class SingleStoreDBTableDefinitionParser(MySQLTableDefinitionParser):
     """Parses the results of a SHOW CREATE TABLE statement."""
 
+    def __init__(self, dialect: Any, preparer: Any) -> None:
+        super(SingleStoreDBTableDefinitionParser, self).__init__(dialect, preparer)
+        # Reflecting many similar tables parses the same constraint
+        # lines over and over, so keep the results keyed on the line.
+        self._constraints_cache: util.LRUCache[str, Tuple[Any, Any]] = \
+            util.LRUCache(1024)
+
     def _parse_constraints(self, line: str) -> Tuple[str, Dict[str, Any]]:
-        type_, spec = super(
-            SingleStoreDBTableDefinitionParser,
-            self,
-        )._parse_constraints(line)
-        re_shard = _re_compile(r'\s+,\s+SHARD\s+KEY\s+\(\)\s+')
-        m = re_shard.match(line)
-        if m:
-            type_ = 'shard_key'
-            spec = {
+        cached = self._constraints_cache.get(line)
+        if cached is None:
+            cached = self._parse_constraints_uncached(line)
+            self._constraints_cache[line] = cached
+        return cached[0], _copy_spec(cached[1])
+
+    def _parse_constraints_uncached(self, line: str) -> Tuple[str, Dict[str, Any]]:
+        # Check the SingleStoreDB-specific form first; when it matches,
+        # none of the MySQL constraint patterns need to be tried. It always
+        # starts with a comma, so most lines can skip the regex entirely.
+        if line.lstrip()[:1] == ',' and _re_empty_shard_key.match(line):
+            return 'shard_key', {
                 'type': None, 'name': 'SHARD', 'using_pre': None,
                 'columns': [], 'using_post': None, 'keyblock': None,
                 'parser': None, 'comment': None, 'version_sql': None,
             }
-        return type_, spec
+
+        # Plain SHARD KEY / SORT KEY lines have no options, so a short
+        # anchored pattern avoids the general KEY regex's optional tails.
+        m = self._re_shard_sort_key.match(line)
+        if m:
+            spec = m.groupdict()
+            spec['columns'] = self._parse_keyexprs(spec['columns'])
+            spec.update(
+                using_pre=None, using_post=None, keyblock=None,
+                parser=None, comment=None, version_sql=None,
+            )
+            return 'key', spec
+
+        return super(
+            SingleStoreDBTableDefinitionParser,
+            self,
+        )._parse_constraints(line)
+
+    def _parse_keyexprs(
+        self,
+        identifiers: str,
+    ) -> List[Tuple[str, Optional[int], str]]:
+        """
+        Unpack a key's column list into (name, length, modifiers).
+
+        Plain lists of quoted names, which is what SHARD KEY and
+        SORT KEY lines contain, are split with a simple scan. Anything
+        else (prefix lengths, ASC / DESC) is left to the regex parser.
+
+        """
+        iq = self.preparer.initial_quote
+        fq = self.preparer.final_quote
+        columns: List[Tuple[str, Optional[int], str]] = []
+        i, n = 0, len(identifiers)
+        while i < n:
+            if identifiers[i] != iq:
+                break
+            end = identifiers.find(fq, i + 1)
+            # Doubled quotes are escapes within the name
+            while end != -1 and identifiers[end + 1:end + 2] == fq:
+                end = identifiers.find(fq, end + 2)
+            # Unterminated or empty names are left to the regex
+            if end == -1 or end == i + 1:
+                break
+            # Column names repeat across the keys of many tables
+            columns.append((sys.intern(identifiers[i + 1:end]), None, ''))
+            i = end + 1
+            if i == n:
+                return columns
+            if identifiers[i] != ',':
+                break
+            i += 1
+            while i < n and identifiers[i] == ' ':
+                i += 1
+        else:
+            return columns
+        return super(
+            SingleStoreDBTableDefinitionParser,
+            self,
+        )._parse_keyexprs(identifiers)
 
     def parse(self, show_create: str, charset: str) -> ReflectedState:
         state = ReflectedState()
@@ -134,6 +215,15 @@ class SingleStoreDBTableDefinitionParser(MySQLTableDefinitionParser):
             ),
         )
 
+        # (SHARD|SORT) KEY `name` (`col`, `col`)
+        self._re_shard_sort_key = _re_compile(
+            r'  '
+            r'(?P<type>SHARD|SORT) KEY'
+            r'(?: +%(iq)s(?P<name>(?:%(esc_fq)s|[^%(fq)s])+)%(fq)s)?'
+            r' +\((?P<columns>[^()]*)\)'
+            r',?$' % quotes,
+        )
+
         # (PRIMARY|UNIQUE|FULLTEXT|SPATIAL) INDEX `name` (USING (BTREE|HASH))?
         # (`col` (ASC|DESC)?, `col` (ASC|DESC)?)
         # KEY_BLOCK_SIZE size | WITH PARSER name  /*!50100 WITH PARSER name */
@@ -11,6 +11,9 @@ import singlestoredb.tests.utils as utils
 import sqlalchemy as sa
 
 
+@unittest.skipUnless(
+    os.environ.get('SINGLESTOREDB_URL'), 'SINGLESTOREDB_URL is not set',
+)
 class TestBasics(unittest.TestCase):
 
     dbname: str = ''
@@ -21,12 +24,7 @@ class TestBasics(unittest.TestCase):
         sql_file = os.path.join(os.path.dirname(__file__), 'test.sql')
         cls.dbname, cls.dbexisted = utils.load_sql(sql_file)
 
-    @classmethod
-    def tearDownClass(cls):
-        if not cls.dbexisted:
-            utils.drop_database(cls.dbname)
-
-    def setUp(self):
+        # One engine (and connection pool) for all tests in the class
         url = os.environ['SINGLESTOREDB_URL']
         if re.match(r'^[\w\-\+]+://', url):
             if not url.startswith('singlestoredb'):
@@ -35,8 +33,16 @@ class TestBasics(unittest.TestCase):
             url = 'singlestoredb://' + url
         if url.endswith('/'):
             url = url[:-1]
-        url = url + '/' + self.__class__.dbname
-        self.engine = sa.create_engine(url)
+        url = url + '/' + cls.dbname
+        cls.engine = sa.create_engine(url)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.engine.dispose()
+        if not cls.dbexisted:
+            utils.drop_database(cls.dbname)
+
+    def setUp(self):
         self.conn = self.engine.connect()
 
     def tearDown(self):
@@ -55,7 +61,7 @@ class TestBasics(unittest.TestCase):
             pass
 
     def test_connection(self):
-        dbs = [x[0] for x in list(self.conn.exec_driver_sql('show databases'))]
+        dbs = [x[0] for x in self.conn.exec_driver_sql('show databases')]
         assert type(self).dbname in dbs, dbs
 
     def test_deferred_connection(self):
@@ -82,7 +88,7 @@ class TestBasics(unittest.TestCase):
     def test_alltypes(self):
         meta = sa.MetaData()
         tbl = sa.Table('alltypes', meta)
-        insp = sa.inspect(self.engine)
+        insp = sa.inspect(self.conn)
         insp.reflect_table(tbl, None)
 
         cols = {col.name: col for col in tbl.columns}
@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+# type: ignore
+"""SingleStoreDB statement compiler testing."""
+from __future__ import annotations
+
+import pytest
+import sqlalchemy as sa
+from sqlalchemy.dialects import mysql
+
+from sqlalchemy_singlestoredb import VECTOR
+from sqlalchemy_singlestoredb.base import SingleStoreDBDialect
+
+
+class IntegerDecorator(sa.TypeDecorator):
+    impl = sa.Integer
+    cache_ok = True
+
+
+CAST_CASES = [
+    (sa.Integer(), 'CAST(x AS SIGNED INTEGER)'),
+    (mysql.INTEGER(unsigned=True), 'CAST(x AS UNSIGNED INTEGER)'),
+    (IntegerDecorator(), 'CAST(x AS SIGNED INTEGER)'),
+    (sa.TIMESTAMP(), 'x :> TIMESTAMP'),
+    (sa.DateTime(), 'x :> DATETIME'),
+    (sa.Date(), 'CAST(x AS DATE)'),
+    (sa.DECIMAL(10, 2), 'CAST(x AS DECIMAL(10, 2))'),
+    (sa.Numeric(10, 2), 'CAST(x AS DECIMAL(10, 2))'),
+    (sa.String(10), 'CAST(x AS CHAR(10))'),
+    (sa.Text(), 'CAST(x AS CHAR)'),
+    (VECTOR(3), 'CAST(x AS VECTOR)'),
+    (sa.LargeBinary(), 'CAST(x AS BINARY)'),
+    (sa.JSON(), 'x :> JSON'),
+    (sa.Float(), 'x :> FLOAT'),
+    (mysql.DOUBLE(), 'x :> DOUBLE'),
+    (sa.Boolean(), 'x :> BOOL'),
+]
+
+
+class TestStatementCompiler:
+
+    @classmethod
+    def setup_class(cls):
+        cls.dialect = SingleStoreDBDialect()
+
+    def compile(self, stmt):
+        return str(stmt.compile(dialect=self.dialect))
+
+    def test_supports_statement_cache(self):
+        # SQLAlchemy only honours the flag when it is set on the dialect
+        # class itself, not inherited from MySQLDialect
+        assert SingleStoreDBDialect.__dict__['supports_statement_cache'] is True
+        assert self.dialect.supports_statement_cache is True
+
+    def test_cache_key(self):
+        table = sa.table('t', sa.column('a'), sa.column('b'))
+        first = sa.select(sa.cast(table.c.a, sa.Integer)).where(table.c.b == 1)
+        second = sa.select(sa.cast(table.c.a, sa.Integer)).where(table.c.b == 2)
+        assert first._generate_cache_key() == second._generate_cache_key()
+        assert self.compile(first) == self.compile(second)
+
+    @pytest.mark.parametrize('type_,expected', CAST_CASES)
+    def test_cast(self, type_, expected):
+        out = self.compile(sa.cast(sa.column('x'), type_))
+        assert out == expected, out
+
+    def test_unsupported_cast_is_skipped(self):
+        with pytest.warns(sa.exc.SAWarning, match='does not support CAST'):
+            out = self.compile(sa.cast(sa.column('x'), mysql.SET('a')))
+        assert out == 'x', out
+
+    @pytest.mark.parametrize(
+        'text,params,expected',
+        [
+            ("a LIKE 'x%'", {}, "a LIKE 'x%'"),
+            ("a LIKE 'x%' AND b = :b", {'b': 1}, "a LIKE 'x%%' AND b = %(b)s"),
+            ('b = :b', {'b': 1}, 'b = %(b)s'),
+        ],
+    )
+    def test_text_percents(self, text, params, expected):
+        out = self.compile(sa.text(text).bindparams(**params))
+        assert out == expected, out
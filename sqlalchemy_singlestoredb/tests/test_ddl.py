@@ -0,0 +1,258 @@
+#!/usr/bin/env python
+# type: ignore
+"""SingleStoreDB DDL and reflection parser testing."""
+from __future__ import annotations
+
+import pytest
+import sqlalchemy as sa
+from sqlalchemy.schema import CreateTable
+
+from sqlalchemy_singlestoredb import ShardKey
+from sqlalchemy_singlestoredb import SortKey
+from sqlalchemy_singlestoredb.base import SingleStoreDBDialect
+from sqlalchemy_singlestoredb.ddlelement import compile_shard_key
+from sqlalchemy_singlestoredb.ddlelement import compile_sort_key
+
+
+KEY_CASES = [
+    ('  SHARD KEY `__SHARDKEY` (`id`)', 'SHARD', ['id']),
+    ('  SHARD KEY (`user_id`,`category_id`)', 'SHARD', ['user_id', 'category_id']),
+    ('  SHARD KEY ()', 'SHARD', []),
+    ('  SORT KEY `__UNORDERED` ()', 'SORT', []),
+    ('  SORT KEY `created_at` (`created_at`)', 'SORT', ['created_at']),
+    ('  SORT KEY (`user_id`,`created_at`)', 'SORT', ['user_id', 'created_at']),
+]
+
+QUOTED_COLUMN_CASES = [
+    ('  SHARD KEY (`order-id`)', 'SHARD', ['order-id']),
+    ('  SHARD KEY (`user id`,`order-id`)', 'SHARD', ['user id', 'order-id']),
+    ('  SORT KEY (`created at`)', 'SORT', ['created at']),
+    ('  SORT KEY `by-date` (`select`,`from`)', 'SORT', ['select', 'from']),
+]
+
+# SHOW CREATE TABLE output mixing regular indexes with shard / sort keys
+SHOW_CREATE_TABLE = (
+    'CREATE TABLE `orders` (\n'
+    '  `id` bigint(20) NOT NULL AUTO_INCREMENT,\n'
+    '  `user_id` int(11) DEFAULT NULL,\n'
+    '  `product_id` int(11) DEFAULT NULL,\n'
+    '  `amount` decimal(10,2) DEFAULT NULL,\n'
+    '  `created_at` datetime DEFAULT NULL,\n'
+    '  PRIMARY KEY (`id`,`user_id`),\n'
+    '  KEY `idx_product` (`product_id`),\n'
+    '  KEY `idx_amount` (`amount`),\n'
+    '  SHARD KEY `__SHARDKEY` (`user_id`),\n'
+    '  SORT KEY `created_at` (`created_at`)\n'
+    ') AUTO_INCREMENT=1'
+)
+
+# Expected CREATE TABLE text for TestTableIntegration tables; the second
+# field receives the SHARD KEY / SORT KEY clauses, if any.
+TABLE_DDL = (
+    '\nCREATE TABLE %s (\n'
+    '\tid INTEGER NOT NULL AUTO_INCREMENT, \n'
+    '\tuser_id INTEGER, \n'
+    '\tcreated_at DATETIME, \n'
+    '\tPRIMARY KEY (id)%s\n'
+    ')'
+)
+SHARD_KEY_DDL = ',\n\tSHARD KEY (%s)'
+SORT_KEY_DDL = ',\n\tSORT KEY (%s)'
+
+
+@pytest.fixture(scope='module')
+def parser():
+    # Building the parser compiles all of its regexes; do it once
+    return SingleStoreDBDialect()._tabledef_parser
+
+
+class TestReflectionParser:
+
+    @pytest.mark.parametrize(
+        'line,expected_type,expected_columns', KEY_CASES + QUOTED_COLUMN_CASES,
+    )
+    def test_parse_key_variants(
+        self, parser, line, expected_type, expected_columns,
+    ):
+        type_, spec = parser._parse_constraints(line)
+        assert type_ == 'key', type_
+        assert spec['type'] == expected_type, spec['type']
+        columns = [x[0] for x in spec['columns']]
+        assert columns == expected_columns, columns
+
+    @pytest.mark.parametrize(
+        'line',
+        [x[0] for x in KEY_CASES + QUOTED_COLUMN_CASES] + [
+            '  SHARD KEY `__SHARDKEY` (`id`),',
+            '  SORT KEY `s` (`a`(10),`b` DESC)',
+        ],
+    )
+    def test_parse_shard_sort_key_matches_mysql(self, parser, line):
+        expected = super(type(parser), parser)._parse_constraints(line)
+        out = parser._parse_constraints(line)
+        assert out == expected, out
+
+    def test_parse_show_create_table(self, parser):
+        state = parser.parse(SHOW_CREATE_TABLE, 'utf8mb4')
+        columns = [x['name'] for x in state.columns]
+        assert columns == [
+            'id', 'user_id', 'product_id', 'amount', 'created_at',
+        ], columns
+        keys = [
+            (x['type'], x['name'], [y[0] for y in x['columns']])
+            for x in state.keys
+        ]
+        assert keys == [
+            ('PRIMARY', None, ['id', 'user_id']),
+            (None, 'idx_product', ['product_id']),
+            (None, 'idx_amount', ['amount']),
+            ('SHARD', '__SHARDKEY', ['user_id']),
+            ('SORT', 'created_at', ['created_at']),
+        ], keys
+
+    @pytest.mark.parametrize(
+        'columns',
+        [
+            '`a`',
+            '`a`,`b`,`c`',
+            '`a`, `b`',
+            '`we``ird`,`b`',
+            '`a`(10),`b`',
+            '`a` DESC,`b`',
+            '`a`,`b`(4) ASC',
+            '``',
+            '`a`,``',
+            '`a`,',
+            '',
+        ],
+    )
+    def test_parse_keyexprs_matches_regex(self, parser, columns):
+        expected = parser._re_keyexprs.findall(columns)
+        expected = [(x[0], int(x[1]) if x[1] else None, x[2]) for x in expected]
+        out = parser._parse_keyexprs(columns)
+        assert out == expected, out
+
+    def test_parse_cached_spec_is_copied(self, parser):
+        line = '  SHARD KEY (`user_id`,`category_id`)'
+        type_, spec = parser._parse_constraints(line)
+        spec['columns'].clear()
+        spec['name'] = 'changed'
+        type_, spec = parser._parse_constraints(line)
+        assert spec['name'] is None, spec['name']
+        columns = [x[0] for x in spec['columns']]
+        assert columns == ['user_id', 'category_id'], columns
+
+
+class TestKeyElements:
+
+    @pytest.mark.parametrize(
+        'key,expected',
+        [
+            (ShardKey('user_id'), 'SHARD KEY (user_id)'),
+            (ShardKey('user_id', '_x1'), 'SHARD KEY (user_id, _x1)'),
+            (ShardKey(), 'SHARD KEY ()'),
+            (ShardKey('`user_id`', 'id'), 'SHARD KEY (`user_id`, id)'),
+        ],
+    )
+    def test_compile_shard_key(self, key, expected):
+        out = compile_shard_key(key, None)
+        assert out == expected, out
+
+    @pytest.mark.parametrize(
+        'key,expected',
+        [
+            (SortKey('created_at'), 'SORT KEY (created_at)'),
+            (SortKey('user_id', 'created_at'), 'SORT KEY (user_id, created_at)'),
+            (SortKey(), 'SORT KEY ()'),
+            (SortKey('created_at DESC'), 'SORT KEY (created_at DESC)'),
+            (SortKey('`Key`'), 'SORT KEY (`Key`)'),
+        ],
+    )
+    def test_compile_sort_key(self, key, expected):
+        out = compile_sort_key(key, None)
+        assert out == expected, out
+
+    @pytest.mark.parametrize(
+        'key,expected',
+        [
+            (ShardKey('id', 'user_id'), "ShardKey('id', 'user_id')"),
+            (ShardKey(), 'ShardKey()'),
+            (SortKey('created_at'), "SortKey('created_at')"),
+            (SortKey(), 'SortKey()'),
+        ],
+    )
+    def test_repr(self, key, expected):
+        assert repr(key) == expected, repr(key)
+
+
+class TestTableIntegration:
+
+    @classmethod
+    def setup_class(cls):
+        # Only the CREATE TABLE text is checked, so compile it directly
+        # against one dialect rather than going through an engine. Every
+        # test uses its own table name and can share the metadata.
+        cls.dialect = SingleStoreDBDialect()
+        cls.metadata = sa.MetaData()
+
+    def create_table(self, name, **info):
+        table = sa.Table(
+            name, self.metadata,
+            sa.Column('id', sa.Integer, primary_key=True),
+            sa.Column('user_id', sa.Integer),
+            sa.Column('created_at', sa.DateTime),
+            info=info,
+        )
+        return str(CreateTable(table).compile(dialect=self.dialect)).rstrip()
+
+    @pytest.mark.parametrize(
+        'name,info,keys_ddl',
+        [
+            (
+                'test_shard',
+                dict(singlestoredb_shard_key=ShardKey('user_id')),
+                SHARD_KEY_DDL % 'user_id',
+            ),
+            (
+                'test_multi_shard',
+                dict(singlestoredb_shard_key=ShardKey('id', 'user_id')),
+                SHARD_KEY_DDL % 'id, user_id',
+            ),
+            (
+                'test_empty_shard',
+                dict(singlestoredb_shard_key=ShardKey()),
+                SHARD_KEY_DDL % '',
+            ),
+            (
+                'test_sort',
+                dict(singlestoredb_sort_key=SortKey('created_at')),
+                SORT_KEY_DDL % 'created_at',
+            ),
+            (
+                'test_both',
+                dict(
+                    singlestoredb_shard_key=ShardKey('user_id'),
+                    singlestoredb_sort_key=SortKey('user_id', 'created_at'),
+                ),
+                SHARD_KEY_DDL % 'user_id' + SORT_KEY_DDL % 'user_id, created_at',
+            ),
+            ('test_plain', {}, ''),
+        ],
+    )
+    def test_table_keys(self, name, info, keys_ddl):
+        ddl = self.create_table(name, **info)
+        assert ddl == TABLE_DDL % (name, keys_ddl), ddl
+
+    def test_key_reused_across_tables(self):
+        shard_key = ShardKey('user_id')
+        first = self.create_table(
+            'test_reuse_1', singlestoredb_shard_key=shard_key,
+        )
+        second = self.create_table(
+            'test_reuse_2', singlestoredb_shard_key=shard_key,
+        )
+        assert first.replace('test_reuse_1', 'test_reuse_2') == second, second
+
+        shard_key.columns = ('id',)
+        ddl = self.create_table('test_reuse_3', singlestoredb_shard_key=shard_key)
+        assert ddl == TABLE_DDL % ('test_reuse_3', SHARD_KEY_DDL % 'id'), ddl